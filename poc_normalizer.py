@@ -8,30 +8,255 @@ Supports field mapping, data validation, type conversion, and error handling.
 
 import json
 import argparse
+import functools
 import sys
 import logging
+import os
 import re
-from datetime import datetime
-from typing import Dict, Any, List, Optional, Union
+import socket
+import time
+from collections import deque
+from itertools import chain, count, islice
+from multiprocessing import Pool
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; fall back to the stdlib codec
+    orjson = None
+
+# Precompiled validation pattern (hot path: evaluated once per field)
+# Anchored by fullmatch(); each optional group has a single way to match,
+# so malformed input fails without backtracking
+_ISO_RE = re.compile(
+    r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{3}(?:\d{3})?)?(?:Z|[+-]\d{2}:\d{2})?'
+)
+
+# Integer literals too long to be sure they fit orjson's 64-bit integers. The
+# delimiters keep quoted digit strings (trace IDs, nanosecond epochs) and
+# float literals from matching
+_WIDE_INT_RE = re.compile(rb'(?:^|[\[:,])\s*-?\d{19,}\s*(?:[,\]}]|$)')
+
+# Severity lookup tables, built once at import
+_SEVERITY_MAP = {
+    # Syslog numeric levels
+    '0': 'critical', '1': 'critical', '2': 'critical',
+    '3': 'high', '4': 'medium', '5': 'medium',
+    '6': 'info', '7': 'debug',
+
+    # Common string values
+    'emergency': 'critical', 'alert': 'critical', 'critical': 'critical',
+    'error': 'high', 'err': 'high', 'high': 'high',
+    'warning': 'medium', 'warn': 'medium', 'medium': 'medium',
+    'notice': 'info', 'information': 'info', 'info': 'info',
+    'debug': 'debug', 'low': 'low'
+}
+
+# Windows event levels override the syslog numeric levels
+_WINDOWS_SEVERITY_MAP = {
+    '1': 'critical', '2': 'high', '3': 'medium', '4': 'info'
+}
+
+# Batches above this size are fanned out to worker processes
+PARALLEL_THRESHOLD = 10000
+_PARALLEL_CHUNK_SIZE = 1000
+
+# Output buffer size; write throughput plateaus in the 64-256KB range
+_WRITE_BUFFER_SIZE = 128 * 1024
+
+# Memoization size for value normalizers; real streams repeat the same
+# gateway IPs, severity labels and flags over and over
+_CACHE_SIZE = 16384
+
+_TRUE_VALUES = frozenset({'true', 'yes', '1', 'on', 'enabled'})
+_FALSE_VALUES = frozenset({'false', 'no', '0', 'off', 'disabled'})
+
+def _normalize_timestamp(value: Any) -> Optional[str]:
+    """Normalize timestamp values to ISO 8601 format."""
+    # If already a string in ISO format, return as-is
+    if isinstance(value, str):
+        # Fast structural probe for the common canonical shapes
+        # (YYYY-MM-DDTHH:MM:SS[.mmm]Z and YYYY-MM-DDTHH:MM:SS+HH:MM)
+        if (len(value) in (20, 24, 25) and value[4] == '-' and value[7] == '-'
+                and value[10] == 'T' and value[13] == ':' and value[16] == ':'):
+            if value[-1] == 'Z' or (value[-6] in '+-' and value[-3] == ':'):
+                return value
+
+        # Check if already in ISO format
+        if _ISO_RE.fullmatch(value):
+            return value
+    
+    return str(value)  # Return as-is if conversion fails
+
+@functools.lru_cache(maxsize=_CACHE_SIZE, typed=True)
+def _normalize_ip_address(value: Any) -> Optional[str]:
+    """Normalize IP address values."""
+    ip_str = str(value).strip()
+    
+    # Basic IP validation via the platform address parser
+    for family in (socket.AF_INET, socket.AF_INET6):
+        try:
+            socket.inet_pton(family, ip_str)
+            return ip_str
+        except (OSError, ValueError):  # ValueError: embedded NUL byte
+            pass
+    
+    return ip_str  # Return original if validation fails
+
+def _normalize_port(value: Any) -> Optional[int]:
+    """Normalize port numbers."""
+    # Fast paths for clean values, avoiding exception handling
+    if type(value) is int:
+        return value if 0 <= value <= 65535 else None
+    if isinstance(value, str) and value.isdecimal():
+        port = int(value)
+        return port if port <= 65535 else None
+    
+    try:
+        port = int(value)
+        if 0 <= port <= 65535:
+            return port
+    except (ValueError, TypeError):
+        pass
+    
+    return None
+
+@functools.lru_cache(maxsize=_CACHE_SIZE, typed=True)
+def _normalize_severity(value: Any) -> Optional[str]:
+    """Normalize severity levels to standard values."""
+    s = value.lower().strip() if isinstance(value, str) else str(value).lower().strip()
+    return _SEVERITY_MAP.get(s, s)
+
+@functools.lru_cache(maxsize=_CACHE_SIZE, typed=True)
+def _normalize_windows_severity(value: Any) -> Optional[str]:
+    """Normalize severity levels using Windows event level semantics."""
+    s = value.lower().strip() if isinstance(value, str) else str(value).lower().strip()
+    severity = _WINDOWS_SEVERITY_MAP.get(s)
+    return severity if severity is not None else _SEVERITY_MAP.get(s, s)
+
+@functools.lru_cache(maxsize=_CACHE_SIZE, typed=True)
+def _normalize_boolean(value: Any) -> Optional[bool]:
+    """Normalize boolean values."""
+    if isinstance(value, bool):
+        return value
+    
+    if isinstance(value, str):
+        val_lower = value.lower().strip()
+        if val_lower in _TRUE_VALUES:
+            return True
+        elif val_lower in _FALSE_VALUES:
+            return False
+    
+    return None
+
+def _to_int(value: Any) -> Optional[int]:
+    """Normalize integer values."""
+    # Fast paths for clean values, avoiding exception handling
+    if type(value) is int:
+        return value
+    if isinstance(value, str) and (value.isdecimal() or (value[:1] == '-' and value[1:].isdecimal())):
+        return int(value)
+    
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+def _to_str(value: Any) -> Optional[str]:
+    """String fields - ensure string type and strip whitespace."""
+    return str(value).strip()
+
+# Field name -> type handler; fields without an entry are kept as strings
+_FIELD_HANDLERS: Dict[str, Callable[[Any], Any]] = {
+    # Timestamp fields
+    'timestamp': _normalize_timestamp, 'ingestion_time': _normalize_timestamp,
+    'file_created': _normalize_timestamp, 'file_modified': _normalize_timestamp,
+    'file_accessed': _normalize_timestamp,
+
+    # IP address fields
+    'source_ip': _normalize_ip_address, 'dest_ip': _normalize_ip_address,
+
+    # Port fields
+    'source_port': _normalize_port, 'dest_port': _normalize_port,
+
+    # Severity field
+    'severity': _normalize_severity,
+
+    # Boolean fields
+    'service_account': _normalize_boolean,
+
+    # Integer fields
+    'process_id': _to_int, 'parent_process_id': _to_int, 'logon_type': _to_int,
+    'priority': _to_int, 'file_size': _to_int, 'bytes_sent': _to_int,
+    'bytes_received': _to_int, 'bytes_total': _to_int, 'packets_sent': _to_int,
+    'packets_received': _to_int, 'duration': _to_int, 'connection_count': _to_int,
+    'exit_code': _to_int, 'http_status': _to_int, 'email_attachment_count': _to_int,
+    'email_size': _to_int, 'vlan_id': _to_int, 'vulnerability_score': _to_int,
+    'risk_score': _to_int
+}
+
+_WINDOWS_FIELD_HANDLERS = {**_FIELD_HANDLERS, 'severity': _normalize_windows_severity}
+
+def _handlers_for(log_source: Any) -> Dict[str, Callable[[Any], Any]]:
+    """Select the type handler table for a log source."""
+    if isinstance(log_source, str) and log_source.lower().startswith('windows'):
+        return _WINDOWS_FIELD_HANDLERS
+    return _FIELD_HANDLERS
+
+def _extract_nested_field(log_data: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """Extract value from a pre-split nested field path (e.g., ('userIdentity', 'userName'))."""
+    value = log_data
+    for key in keys:
+        value = value.get(key) if value.__class__ is dict else None
+        if value is None:
+            return None
+    return value
+
+# Compiled mapping for one log source: raw field -> (target field, handler,
+# from default mapping), raw nested field -> pre-split key path, the set of
+# mapped target fields, and the handler table for unmapped fields
+_SchemaPlan = Tuple[
+    Dict[str, Tuple[str, Callable[[Any], Any], bool]],
+    Dict[str, Tuple[str, ...]],
+    frozenset,
+    Dict[str, Callable[[Any], Any]]
+]
+
+def _new_stats() -> Dict[str, Any]:
+    """Zeroed normalization statistics."""
+    return {
+        'processed': 0,
+        'normalized': 0,
+        'errors': 0,
+        'warnings': 0,
+        'sources': {}
+    }
 
 class ProductionNormalizer:
-    def __init__(self, mapping_file: str, schema_file: Optional[str] = None):
+    def __init__(self, mapping_file: str, schema_file: Optional[str] = None, workers: int = 1):
         """Initialize the normalizer with mapping and optional schema validation."""
         self.mappings = self._load_mappings(mapping_file)
-        self.schema = self._load_schema(schema_file) if schema_file else None
-        self.stats = {
-            'processed': 0,
-            'normalized': 0,
-            'errors': 0,
-            'warnings': 0,
-            'sources': {}
+        # Nested field paths (e.g. 'userIdentity.userName'), split once at load time
+        self._nested_paths: Dict[str, Tuple[str, ...]] = {
+            raw_field: tuple(raw_field.split('.'))
+            for mapping in self.mappings.values() for raw_field in mapping if '.' in raw_field
         }
+        self.schema = self._load_schema(schema_file) if schema_file else None
+        self.workers = workers
+        self.stats = _new_stats()
+        # Compiled per-source schema plans, built on first sighting of a source
+        self._plans: Dict[str, _SchemaPlan] = {}
         
     def _load_mappings(self, mapping_file: str) -> Dict[str, Dict[str, str]]:
         """Load field mappings from JSON file."""
         try:
             with open(mapping_file, 'r') as f:
                 mappings = json.load(f)
+            # Intern field names so dict lookups against them hit the identity fast path
+            mappings = {
+                sys.intern(source): {sys.intern(raw): sys.intern(target) for raw, target in fields.items()}
+                for source, fields in mappings.items()
+            }
             logging.info(f"Loaded mappings for {len(mappings)} log sources")
             return mappings
         except Exception as e:
@@ -49,256 +274,362 @@ class ProductionNormalizer:
             logging.warning(f"Failed to load schema from {schema_file}: {e}")
             return None
     
-    def _normalize_timestamp(self, value: Any) -> Optional[str]:
-        """Normalize timestamp values to ISO 8601 format."""
-        if not value:
-            return None
-            
-        # If already a string in ISO format, return as-is
-        if isinstance(value, str):
-            # Check if already in ISO format
-            iso_patterns = [
-                r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{3})?Z?$',
-                r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{6})?[+-]\d{2}:\d{2}$'
-            ]
-            for pattern in iso_patterns:
-                if re.match(pattern, value):
-                    return value
-        
-        return str(value)  # Return as-is if conversion fails
+    def _utc_now_iso(self) -> str:
+        """Current UTC time in ISO 8601 with microseconds and a 'Z' suffix."""
+        sec, nsec = divmod(time.time_ns(), 1_000_000_000)
+        return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec))}.{nsec // 1000:06d}Z"
     
-    def _normalize_ip_address(self, value: Any) -> Optional[str]:
-        """Normalize IP address values."""
-        if not value:
-            return None
-        
-        ip_str = str(value).strip()
-        
-        # Basic IP validation patterns
-        ipv4_pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-        ipv6_pattern = r'^([0-9a-fA-F]{0,4}:){2,7}[0-9a-fA-F]{0,4}$'
-        
-        if re.match(ipv4_pattern, ip_str) or re.match(ipv6_pattern, ip_str):
-            return ip_str
-        
-        return ip_str  # Return original if validation fails
+    def _plan_for(self, log_source: str) -> _SchemaPlan:
+        """Get the compiled schema plan for a log source.
+        
+        A plan maps each raw field to its (target field, type handler,
+        from default mapping) triple for the merged default and
+        source-specific mappings, records the pre-split key paths of nested
+        source fields and the set of target fields, and carries the handler
+        table used for unmapped fields.
+        """
+        plan = self._plans.get(log_source)
+        if plan is None:
+            source_mapping = self.mappings.get(log_source, {})
+            default_mapping = self.mappings.get('default', {})
+            handlers = _handlers_for(log_source)
+            steps = {
+                raw_field: (target_field, handlers.get(target_field, _to_str),
+                            raw_field not in source_mapping)
+                for raw_field, target_field in {**default_mapping, **source_mapping}.items()
+            }
+            nested_paths = {
+                raw_field: self._nested_paths[raw_field]
+                for raw_field in source_mapping if '.' in raw_field
+            }
+            targets = frozenset(target_field for target_field, _, _ in steps.values())
+            plan = (steps, nested_paths, targets, handlers)
+            self._plans[log_source] = plan
+        return plan
     
-    def _normalize_port(self, value: Any) -> Optional[int]:
-        """Normalize port numbers."""
-        if not value:
-            return None
-        
-        try:
-            port = int(value)
-            if 0 <= port <= 65535:
-                return port
-        except (ValueError, TypeError):
-            pass
-        
-        return None
-    
-    def _normalize_severity(self, value: Any) -> Optional[str]:
-        """Normalize severity levels to standard values."""
-        if not value:
-            return None
-        
-        severity_map = {
-            # Syslog numeric levels
-            '0': 'critical', '1': 'critical', '2': 'critical',
-            '3': 'high', '4': 'medium', '5': 'medium',
-            '6': 'info', '7': 'debug',
-            
-            # Windows levels
-            '1': 'critical', '2': 'high', '3': 'medium', '4': 'info',
-            
-            # Common string values
-            'emergency': 'critical', 'alert': 'critical', 'critical': 'critical',
-            'error': 'high', 'err': 'high', 'high': 'high',
-            'warning': 'medium', 'warn': 'medium', 'medium': 'medium',
-            'notice': 'info', 'information': 'info', 'info': 'info',
-            'debug': 'debug', 'low': 'low'
-        }
-        
-        severity_str = str(value).lower().strip()
-        return severity_map.get(severity_str, severity_str)
-    
-    def _normalize_boolean(self, value: Any) -> Optional[bool]:
-        """Normalize boolean values."""
-        if isinstance(value, bool):
-            return value
-        
-        if isinstance(value, str):
-            true_values = {'true', 'yes', '1', 'on', 'enabled'}
-            false_values = {'false', 'no', '0', 'off', 'disabled'}
-            
-            val_lower = value.lower().strip()
-            if val_lower in true_values:
-                return True
-            elif val_lower in false_values:
-                return False
-        
-        return None
-    
-    def _apply_type_conversion(self, field: str, value: Any) -> Any:
-        """Apply type-specific normalization based on field name."""
-        if value is None or value == '':
-            return None
-        
-        # Timestamp fields
-        timestamp_fields = {'timestamp', 'ingestion_time', 'file_created', 'file_modified', 'file_accessed'}
-        if field in timestamp_fields:
-            return self._normalize_timestamp(value)
-        
-        # IP address fields
-        ip_fields = {'source_ip', 'dest_ip'}
-        if field in ip_fields:
-            return self._normalize_ip_address(value)
-        
-        # Port fields
-        port_fields = {'source_port', 'dest_port'}
-        if field in port_fields:
-            return self._normalize_port(value)
-        
-        # Severity field
-        if field == 'severity':
-            return self._normalize_severity(value)
-        
-        # Boolean fields
-        boolean_fields = {'service_account'}
-        if field in boolean_fields:
-            return self._normalize_boolean(value)
-        
-        # Integer fields
-        integer_fields = {
-            'process_id', 'parent_process_id', 'logon_type', 'priority',
-            'file_size', 'bytes_sent', 'bytes_received', 'bytes_total',
-            'packets_sent', 'packets_received', 'duration', 'connection_count',
-            'exit_code', 'http_status', 'email_attachment_count', 'email_size',
-            'vlan_id', 'vulnerability_score', 'risk_score'
-        }
-        if field in integer_fields:
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return None
-        
-        # String fields - ensure string type and strip whitespace
-        return str(value).strip() if value else None
-    
-    def _extract_nested_field(self, log_data: Dict[str, Any], field_path: str) -> Any:
-        """Extract value from nested field path (e.g., 'userIdentity.userName')."""
-        try:
-            value = log_data
-            for key in field_path.split('.'):
-                if isinstance(value, dict) and key in value:
-                    value = value[key]
-                else:
-                    return None
-            return value
-        except Exception:
-            return None
-    
-    def _normalize_single_log(self, log_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize a single log entry."""
-        if not isinstance(log_data, dict):
-            self.stats['errors'] += 1
-            logging.warning("Invalid log entry: not a dictionary")
-            return {}
-        
+    def _normalize_single_log(self, log_data: Dict[str, Any], ingest_ts: Optional[str] = None,
+                              normalized_log: Optional[Dict[str, Any]] = None
+                              ) -> Tuple[Dict[str, Any], Any, bool]:
+        """Normalize a single log entry, optionally into a reusable scratch dict.
+        
+        Returns the normalized log, its log source and whether a missing
+        timestamp was filled in; the caller keeps the statistics.
+        """
         # Determine log source
         log_source = log_data.get('log_source', 'default')
         
-        # Get appropriate mapping
-        source_mapping = self.mappings.get(log_source, {})
-        default_mapping = self.mappings.get('default', {})
+        # Get the compiled plan for this source
+        steps, nested_paths, targets, handlers = self._plan_for(log_source)
         
-        # Track source statistics
-        if log_source not in self.stats['sources']:
-            self.stats['sources'][log_source] = 0
-        self.stats['sources'][log_source] += 1
+        if normalized_log is None:
+            normalized_log = {}
+        else:
+            normalized_log.clear()
         
-        normalized_log = {}
-        processed_fields = set()
+        # Hot loop: bind lookups to locals and convert values inline
+        step_for = steps.get
+        handler_for = handlers.get
         
-        # First pass: apply source-specific mappings
-        for raw_field, value in log_data.items():
-            if raw_field in source_mapping:
-                normalized_field = source_mapping[raw_field]
-                # Handle nested field extraction
-                if '.' in raw_field:
-                    actual_value = self._extract_nested_field(log_data, raw_field)
-                    if actual_value is not None:
-                        normalized_value = self._apply_type_conversion(normalized_field, actual_value)
-                        normalized_log[normalized_field] = normalized_value
-                else:
-                    normalized_value = self._apply_type_conversion(normalized_field, value)
-                    normalized_log[normalized_field] = normalized_value
-                processed_fields.add(raw_field)
+        # Target fields written by an unmapped raw field of the same name
+        claimed = None
         
-        # Second pass: apply default mappings for unprocessed fields
+        # Single pass: mapped fields follow the plan, unmapped fields keep their
+        # name. When several raw fields land on one target, an unmapped field
+        # beats a source mapping, which beats a default mapping; among
+        # source-mapped fields the last wins, among default-mapped the first
         for raw_field, value in log_data.items():
-            if raw_field not in processed_fields and raw_field in default_mapping:
-                normalized_field = default_mapping[raw_field]
-                normalized_value = self._apply_type_conversion(normalized_field, value)
-                # Don't overwrite fields already mapped by source-specific mapping
-                if normalized_field not in normalized_log:
-                    normalized_log[normalized_field] = normalized_value
-                processed_fields.add(raw_field)
-        
-        # Third pass: keep unmapped fields as-is
-        for raw_field, value in log_data.items():
-            if raw_field not in processed_fields:
-                normalized_value = self._apply_type_conversion(raw_field, value)
-                normalized_log[raw_field] = normalized_value
+            step = step_for(raw_field)
+            if step is None:
+                normalized_field = raw_field
+                convert = handler_for(raw_field, _to_str)
+                if raw_field in targets:
+                    if claimed is None:
+                        claimed = set()
+                    claimed.add(raw_field)
+            else:
+                normalized_field, convert, from_default = step
+                if from_default:
+                    if normalized_field in normalized_log:
+                        continue
+                elif claimed is not None and normalized_field in claimed:
+                    continue
+                # Handle nested field extraction
+                if nested_paths and raw_field in nested_paths:
+                    value = _extract_nested_field(log_data, nested_paths[raw_field])
+                    if value is None:
+                        continue
+            if value is None or value == '':
+                normalized_log[normalized_field] = None
+            else:
+                try:
+                    normalized_log[normalized_field] = convert(value)
+                except TypeError:
+                    # Unhashable values (lists, dicts) bypass memoized handlers
+                    normalized_log[normalized_field] = getattr(convert, '__wrapped__', convert)(value)
+        
+        if ingest_ts is None:
+            ingest_ts = self._utc_now_iso()
         
         # Ensure required fields
-        if 'timestamp' not in normalized_log:
-            normalized_log['timestamp'] = datetime.utcnow().isoformat() + 'Z'
-            self.stats['warnings'] += 1
+        missing_timestamp = 'timestamp' not in normalized_log
+        if missing_timestamp:
+            normalized_log['timestamp'] = ingest_ts
         
         if 'log_source' not in normalized_log:
             normalized_log['log_source'] = log_source
         
         # Add enrichment fields
-        normalized_log['ingestion_time'] = datetime.utcnow().isoformat() + 'Z'
+        normalized_log['ingestion_time'] = ingest_ts
         
-        return normalized_log
+        return normalized_log, log_source, missing_timestamp
     
     def normalize_logs(self, input_logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Normalize a list of log entries."""
-        normalized_logs = []
+        return list(self.iter_normalized(input_logs))
+    
+    def iter_normalized(self, input_logs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Lazily normalize a stream of log entries."""
+        return self._iter(input_logs, serialize=False)
+    
+    def iter_serialized(self, input_logs: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        """Lazily normalize a stream of log entries into indented JSON bytes.
         
-        for i, log_entry in enumerate(input_logs):
-            try:
-                self.stats['processed'] += 1
-                normalized_log = self._normalize_single_log(log_entry)
-                
-                if normalized_log:  # Only add non-empty normalized logs
-                    normalized_logs.append(normalized_log)
-                    self.stats['normalized'] += 1
-                else:
-                    self.stats['errors'] += 1
+        Each entry is built in a single reused scratch dict and serialized
+        immediately, so no per-log output dict outlives its serialization.
+        """
+        return self._iter(input_logs, serialize=True)
+    
+    def _iter(self, input_logs: Iterable[Dict[str, Any]], serialize: bool) -> Iterator[Any]:
+        """Dispatch a batch to the serial or parallel normalization path."""
+        # One ingestion timestamp for the whole batch
+        ingest_ts = self._utc_now_iso()
+        
+        if self.workers <= 1:
+            yield from self._iter_serial(enumerate(input_logs), ingest_ts, serialize)
+            return
+        
+        # Only fan out when the batch is large enough to amortize the pool
+        input_iter = iter(input_logs)
+        head = list(islice(input_iter, PARALLEL_THRESHOLD + 1))
+        if len(head) <= PARALLEL_THRESHOLD:
+            yield from self._iter_serial(enumerate(head), ingest_ts, serialize)
+        else:
+            yield from self._iter_parallel(chain(head, input_iter), ingest_ts, serialize)
+    
+    def _iter_serial(self, indexed_logs: Iterable[Tuple[int, Any]], ingest_ts: str,
+                     serialize: bool = False) -> Iterator[Any]:
+        """Normalize (index, entry) pairs in the current process."""
+        scratch = {} if serialize else None
+        # Count in locals and fold into self.stats once, when the batch ends
+        processed = normalized = errors = warnings = 0
+        sources: Dict[Any, int] = {}
+        try:
+            for i, log_entry in indexed_logs:
+                processed += 1
+                if not isinstance(log_entry, dict):
+                    errors += 1
+                    logging.warning(f"Invalid log entry {i}: not a dictionary")
+                    continue
+                try:
+                    normalized_log, log_source, missing_timestamp = self._normalize_single_log(
+                        log_entry, ingest_ts, scratch)
+                    sources[log_source] = sources.get(log_source, 0) + 1
+                    warnings += missing_timestamp
                     
-            except Exception as e:
-                self.stats['errors'] += 1
-                logging.error(f"Error normalizing log entry {i}: {e}")
-                continue
-        
+                    if not normalized_log:  # Only yield non-empty normalized logs
+                        errors += 1
+                        continue
+                    entry = _json_dumps_entry(normalized_log) if serialize else normalized_log
+                    
+                except Exception as e:
+                    errors += 1
+                    logging.error(f"Error normalizing log entry {i}: {e}")
+                    continue
+                
+                normalized += 1
+                yield entry
+        finally:
+            self._merge_chunk([], (processed, normalized, errors, warnings), sources)
+    
+    def _iter_parallel(self, input_logs: Iterator[Any], ingest_ts: str,
+                       serialize: bool) -> Iterator[Any]:
+        """Normalize entries in chunks across a pool of worker processes."""
+        # Bound the in-flight chunks so streamed input is not read ahead unboundedly
+        max_pending = self.workers * 2
+        pending = deque()
+        
+        with Pool(self.workers, initializer=_worker_init, initargs=(self,)) as pool:
+            for start in count(0, _PARALLEL_CHUNK_SIZE):
+                chunk = list(islice(input_logs, _PARALLEL_CHUNK_SIZE))
+                if not chunk:
+                    break
+                pending.append(pool.apply_async(_worker_normalize, (start, chunk, ingest_ts, serialize)))
+                if len(pending) >= max_pending:
+                    yield from self._merge_chunk(*pending.popleft().get())
+            
+            while pending:
+                yield from self._merge_chunk(*pending.popleft().get())
+    
+    def _merge_chunk(self, normalized_logs: List[Any], counts: Tuple[int, int, int, int],
+                     sources: Dict[str, int]) -> List[Any]:
+        """Fold a chunk's statistics into ours and return its logs."""
+        stats = self.stats
+        processed, normalized, errors, warnings = counts
+        stats['processed'] += processed
+        stats['normalized'] += normalized
+        stats['errors'] += errors
+        stats['warnings'] += warnings
+        stats_sources = stats['sources']
+        for source, source_count in sources.items():
+            stats_sources[source] = stats_sources.get(source, 0) + source_count
         return normalized_logs
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get normalization statistics."""
         return self.stats.copy()
 
+# Per-process normalizer used by pool workers
+_worker_normalizer: Optional[ProductionNormalizer] = None
+
+def _worker_init(normalizer: ProductionNormalizer) -> None:
+    """Install the normalizer in a freshly started worker process."""
+    global _worker_normalizer
+    _worker_normalizer = normalizer
+
+def _worker_normalize(start: int, chunk: List[Any], ingest_ts: str, serialize: bool
+                      ) -> Tuple[List[Any], Tuple[int, int, int, int], Dict[str, int]]:
+    """Normalize one chunk in a worker.
+    
+    Returns the logs, the chunk's (processed, normalized, errors, warnings)
+    counts and its per-source counts; nothing is shared across processes.
+    """
+    normalizer = _worker_normalizer
+    normalizer.stats = _new_stats()
+    normalized_logs = list(normalizer._iter_serial(enumerate(chunk, start), ingest_ts, serialize))
+    stats = normalizer.stats
+    counts = (stats['processed'], stats['normalized'], stats['errors'], stats['warnings'])
+    return normalized_logs, counts, stats['sources']
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON document, using orjson when it can round-trip the input.
+    
+    orjson silently turns integers beyond 64 bits into floats, so a document
+    with a 19+ digit integer literal is parsed by the stdlib, which keeps it
+    exact. For JSON array input that is the whole file, at stdlib speed.
+    """
+    if orjson is not None and not _WIDE_INT_RE.search(data):
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps_entry(log: Dict[str, Any]) -> bytes:
+    """Serialize one log entry as 2-space indented UTF-8 JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(log, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; let the stdlib handle them
+    return json.dumps(log, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _read_logs(input_file: str, stats: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """Stream log entries from a JSON array or JSON Lines file.
+    
+    Entries are validated here, once: anything that is not a JSON object,
+    including JSON Lines that fail to parse, is logged and skipped, and
+    counted as processed and errored in stats.
+    """
+    def skip(what: str) -> None:
+        logging.warning(f"Skipping {what}")
+        if stats is not None:
+            stats['processed'] += 1
+            stats['errors'] += 1
+    
+    with open(input_file, 'rb') as f:
+        # Peek at the first non-whitespace byte to detect the format
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        
+        if first == b'[':
+            # JSON arrays cannot be parsed incrementally; parse in one call
+            for i, entry in enumerate(_json_loads(f.read())):
+                if entry.__class__ is dict:
+                    yield entry
+                else:
+                    skip(f"log entry {i}: not a JSON object")
+            return
+        
+        # JSON Lines: one bad line costs that entry, not the whole run. A bad
+        # first line means the file is not JSON Lines at all (a pretty-printed
+        # object, a BOM, ...), which fails the run instead of yielding nothing
+        first_line = True
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = _json_loads(line)
+            except ValueError as e:
+                if first_line:
+                    logging.error(f"Line {line_number} is not valid JSON; "
+                                  "input must be a JSON array or JSON Lines")
+                    raise
+                skip(f"line {line_number}: invalid JSON ({e})")
+                continue
+            first_line = False
+            if entry.__class__ is dict:
+                yield entry
+            else:
+                skip(f"line {line_number}: not a JSON object")
+
+def _write_logs(output_file: str, entries: Iterable[bytes],
+                buffer_size: int = _WRITE_BUFFER_SIZE) -> int:
+    """Incrementally write serialized entries as a JSON array; returns the count.
+    
+    Output goes to a temporary file that replaces output_file only once every
+    entry is written, so a failed run leaves no truncated output behind.
+    """
+    count = 0
+    partial_file = f"{output_file}.tmp"
+    try:
+        with open(partial_file, 'wb', buffering=buffer_size) as f:
+            # Batch entries so the file sees one large write per buffer_size bytes
+            pending = bytearray(b'[')
+            for entry in entries:
+                pending += b',\n  ' if count else b'\n  '
+                pending += entry.replace(b'\n', b'\n  ')
+                count += 1
+                if len(pending) >= buffer_size:
+                    f.write(pending)
+                    pending.clear()
+            pending += b'\n]' if count else b']'
+            f.write(pending)
+        os.replace(partial_file, output_file)
+    except BaseException:
+        if os.path.exists(partial_file):
+            os.remove(partial_file)
+        raise
+    return count
+
+def _default_workers() -> int:
+    """CPUs this process may run on, which can be fewer than the machine has."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
 def main():
     parser = argparse.ArgumentParser(
         description='Production Log Normalizer for Security Logs',
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
-    parser.add_argument('input_file', help='Input JSON file containing log array')
+    parser.add_argument('input_file', help='Input JSON array or JSON Lines file of log entries')
     parser.add_argument('output_file', help='Output JSON file for normalized logs')
     parser.add_argument('mapping_file', help='JSON file containing field mappings')
     parser.add_argument('--schema', help='Optional JSON schema file for validation')
+    parser.add_argument('--workers', type=int, default=_default_workers(),
+                       help='Worker processes for batches larger than '
+                            f'{PARALLEL_THRESHOLD} logs (default: usable CPU count)')
+    parser.add_argument('--write-buffer-size', type=int, default=_WRITE_BUFFER_SIZE,
+                       help=f'Output write batch size in bytes (default: {_WRITE_BUFFER_SIZE})')
     parser.add_argument('--stats', action='store_true', 
                        help='Print normalization statistics')
     parser.add_argument('--verbose', '-v', action='store_true',
@@ -318,27 +649,14 @@ def main():
     
     try:
         # Initialize normalizer
-        normalizer = ProductionNormalizer(args.mapping_file, args.schema)
-        
-        # Load input logs
-        logging.info(f"Loading logs from {args.input_file}")
-        with open(args.input_file, 'r', encoding='utf-8') as f:
-            input_logs = json.load(f)
-        
-        if not isinstance(input_logs, list):
-            logging.error("Input file must contain a JSON array of log objects")
-            sys.exit(1)
-        
-        logging.info(f"Loaded {len(input_logs)} log entries")
-        
-        # Normalize logs
-        logging.info("Starting normalization process")
-        normalized_logs = normalizer.normalize_logs(input_logs)
-        
-        # Write output
-        logging.info(f"Writing {len(normalized_logs)} normalized logs to {args.output_file}")
-        with open(args.output_file, 'w', encoding='utf-8') as f:
-            json.dump(normalized_logs, f, indent=2, ensure_ascii=False, default=str)
+        normalizer = ProductionNormalizer(args.mapping_file, args.schema, args.workers)
+        
+        # Stream logs from input, through the normalizer, to output
+        logging.info(f"Streaming logs from {args.input_file} to {args.output_file}")
+        input_logs = _read_logs(args.input_file, normalizer.stats)
+        written = _write_logs(args.output_file, normalizer.iter_serialized(input_logs),
+                              args.write_buffer_size)
+        logging.info(f"Wrote {written} normalized logs to {args.output_file}")
         
         # Print statistics
         if args.stats:
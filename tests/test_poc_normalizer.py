@@ -0,0 +1,301 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import poc_normalizer
+from poc_normalizer import (
+    ProductionNormalizer, _read_logs, _write_logs, _json_dumps_entry, _normalize_ip_address,
+    _normalize_severity, _normalize_windows_severity, _normalize_port, _to_int,
+    _normalize_timestamp
+)
+
+MAPPINGS = {
+    'default': {'timestamp': 'timestamp', 'severity': 'severity', 'log_source': 'log_source'},
+    'network': {'src_ip': 'source_ip', 'src_port': 'source_port', 'dst_port': 'dest_port',
+                'bytes': 'bytes_sent', 'pid': 'process_id'},
+}
+
+
+def make_normalizer(test, mappings=MAPPINGS, **kwargs):
+    """Build a ProductionNormalizer over a temporary mapping file."""
+    tmp = tempfile.TemporaryDirectory()
+    test.addCleanup(tmp.cleanup)
+    mapping_file = os.path.join(tmp.name, 'mapping.json')
+    with open(mapping_file, 'w') as f:
+        json.dump(mappings, f)
+    return ProductionNormalizer(mapping_file, **kwargs)
+
+
+def fixed_clock():
+    """Pin the ingestion timestamp so separate runs compare equal."""
+    return mock.patch.object(ProductionNormalizer, '_utc_now_iso',
+                             return_value='2024-01-01T00:00:00.000000Z')
+
+
+class ValueNormalizerTest(unittest.TestCase):
+    def test_ip_address_passes_through_valid_and_invalid_values(self):
+        self.assertEqual(_normalize_ip_address(' 10.0.0.1 '), '10.0.0.1')
+        self.assertEqual(_normalize_ip_address('::1'), '::1')
+        self.assertEqual(_normalize_ip_address('not-an-ip'), 'not-an-ip')
+
+    def test_ip_address_with_nul_byte_is_kept(self):
+        self.assertEqual(_normalize_ip_address('10.0.0.1\x00'), '10.0.0.1\x00')
+
+    # Shapes taken by the structural probe without running the pattern
+    CANONICAL_TIMESTAMPS = ('2024-01-01T00:00:00Z', '2024-01-01T00:00:00.123Z',
+                            '2024-01-01T00:00:00+02:00', '2024-01-01T00:00:00-05:30')
+    OTHER_ISO_TIMESTAMPS = ('2024-01-01T00:00:00', '2024-01-01T00:00:00.123',
+                            '2024-01-01T00:00:00.123456Z', '2024-01-01T00:00:00.123+02:00')
+    NOT_ISO_TIMESTAMPS = ('', 'Z', '2024-01-01T00:00:00+0000', '2024-01-01 00:00:00Z',
+                          '2024-01-01T00:00:00.12Z', '2024-01-01T00:00:00Zjunk',
+                          'Jan  1 00:00:00', '2024-01-01T00:00:00+02:00\n')
+
+    def test_timestamp_strings_are_returned_unchanged(self):
+        for value in self.CANONICAL_TIMESTAMPS + self.OTHER_ISO_TIMESTAMPS + self.NOT_ISO_TIMESTAMPS:
+            self.assertEqual(_normalize_timestamp(value), value)
+
+    def test_timestamp_probe_and_pattern(self):
+        iso_re = mock.Mock(wraps=poc_normalizer._ISO_RE)
+        with mock.patch.object(poc_normalizer, '_ISO_RE', iso_re):
+            for value in self.CANONICAL_TIMESTAMPS:
+                _normalize_timestamp(value)
+                iso_re.fullmatch.assert_not_called()
+            for value in self.OTHER_ISO_TIMESTAMPS + self.NOT_ISO_TIMESTAMPS:
+                _normalize_timestamp(value)
+                iso_re.fullmatch.assert_called_with(value)
+        
+        # The probe only takes shapes the pattern accepts too
+        for value in self.CANONICAL_TIMESTAMPS + self.OTHER_ISO_TIMESTAMPS:
+            self.assertTrue(poc_normalizer._ISO_RE.fullmatch(value), value)
+        for value in self.NOT_ISO_TIMESTAMPS:
+            self.assertIsNone(poc_normalizer._ISO_RE.fullmatch(value), value)
+
+    def test_non_string_timestamps_are_stringified(self):
+        self.assertEqual(_normalize_timestamp(1700000000), '1700000000')
+        self.assertEqual(_normalize_timestamp(0), '0')
+
+    def test_port(self):
+        for value, expected in ((80, 80), (0, 0), (65535, 65535), (65536, None), (-1, None),
+                                ('443', 443), ('65536', None), ('-5', None), (' 80', 80),
+                                ('+7', 7), ('\u0663', 3), ('80.5', None), ('x', None),
+                                (True, 1), (8.9, 8), ([80], None)):
+            self.assertEqual(_normalize_port(value), expected, value)
+
+    def test_int(self):
+        for value, expected in ((7, 7), (-5, -5), (2 ** 70, 2 ** 70), ('12', 12), ('-5', -5),
+                                (' 80', 80), ('+7', 7), ('\u0663', 3), ('-', None),
+                                ('1.5', None), ('x', None), (True, 1), (2.9, 2), ({}, None)):
+            self.assertEqual(_to_int(value), expected, value)
+
+    def test_windows_event_levels_override_syslog_levels(self):
+        for value, syslog, windows in (('1', 'critical', 'critical'), ('2', 'critical', 'high'),
+                                       (3, 'high', 'medium'), (' 4 ', 'medium', 'info'),
+                                       ('6', 'info', 'info'), ('Warning', 'medium', 'medium'),
+                                       ('custom', 'custom', 'custom')):
+            self.assertEqual(_normalize_severity(value), syslog)
+            self.assertEqual(_normalize_windows_severity(value), windows)
+
+
+class StatisticsTest(unittest.TestCase):
+    def test_batch_statistics(self):
+        normalizer = make_normalizer(self)
+        normalizer.normalize_logs([
+            {'log_source': 'network', 'timestamp': '2024-01-01T00:00:00Z'},
+            {'log_source': 'network'},
+            {'message': 'no source, no timestamp'},
+        ])
+        self.assertEqual(normalizer.get_statistics(), {
+            'processed': 3, 'normalized': 3, 'errors': 0, 'warnings': 2,
+            'sources': {'network': 2, 'default': 1},
+        })
+
+
+class FalsyValueTest(unittest.TestCase):
+    def test_falsy_values_are_converted_not_nulled(self):
+        normalizer = make_normalizer(self)
+        [log] = normalizer.normalize_logs([{
+            'log_source': 'linux_syslog', 'timestamp': '2024-01-01T00:00:00Z',
+            'uid': 0, 'pid': 0, 'bytes': 0, 'severity': 0, 'flag': False, 'tags': [],
+            'empty': '', 'missing': None,
+        }])
+        self.assertEqual(log['uid'], '0')
+        self.assertEqual(log['pid'], '0')
+        self.assertEqual(log['bytes'], '0')
+        self.assertEqual(log['severity'], 'critical')
+        self.assertEqual(log['flag'], 'False')
+        self.assertEqual(log['tags'], '[]')
+        self.assertIsNone(log['empty'])
+        self.assertIsNone(log['missing'])
+
+    def test_non_dict_entry_is_reported_and_counted(self):
+        normalizer = make_normalizer(self)
+        with self.assertLogs(level='WARNING') as logs:
+            output = normalizer.normalize_logs([['not', 'a', 'log'], {'log_source': 'network'}])
+        self.assertEqual(len(output), 1)
+        self.assertIn('Invalid log entry 0: not a dictionary', logs.output[0])
+        self.assertEqual(normalizer.get_statistics()['errors'], 1)
+
+
+class ParallelTest(unittest.TestCase):
+    def test_parallel_run_matches_serial_run(self):
+        logs = []
+        for i in range(40):
+            logs.append({'log_source': ('network', 'windows', 'other')[i % 3],
+                         'src_ip': f'10.0.0.{i}', 'src_port': str(i * 1000), 'severity': str(i % 8)})
+            if i % 4:
+                logs[-1]['timestamp'] = f'2024-01-01T00:00:{i:02d}Z'
+            if i % 9 == 0:
+                logs.append(['not', 'a', 'log'])
+        
+        results = {}
+        for workers in (1, 2):
+            for serialize in (False, True):
+                normalizer = make_normalizer(self, workers=workers)
+                with fixed_clock(), \
+                        mock.patch.object(poc_normalizer, 'PARALLEL_THRESHOLD', 5), \
+                        mock.patch.object(poc_normalizer, '_PARALLEL_CHUNK_SIZE', 3):
+                    if serialize:
+                        output = list(normalizer.iter_serialized(logs))
+                    else:
+                        output = normalizer.normalize_logs(logs)
+                results[workers, serialize] = (output, normalizer.get_statistics())
+        
+        for serialize in (False, True):
+            self.assertEqual(results[2, serialize], results[1, serialize])
+        self.assertEqual(results[1, False][1]['errors'], 5)
+
+
+class IngestionTimeTest(unittest.TestCase):
+    def test_format(self):
+        normalizer = make_normalizer(self)
+        for time_ns in (0, 1_700_000_000_000_000_000, 1_700_000_000_123_456_789):
+            with mock.patch('time.time_ns', return_value=time_ns):
+                now = normalizer._utc_now_iso()
+            self.assertRegex(now, r'\A\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z\Z')
+        self.assertEqual(now, '2023-11-14T22:13:20.123456Z')
+
+    def test_whole_batch_shares_one_ingestion_time(self):
+        normalizer = make_normalizer(self)
+        logs = normalizer.normalize_logs([{'log_source': 'network'}, {'log_source': 'other'}])
+        self.assertEqual(logs[0]['ingestion_time'], logs[1]['ingestion_time'])
+        self.assertEqual(logs[0]['timestamp'], logs[0]['ingestion_time'])
+
+
+class FieldPriorityTest(unittest.TestCase):
+    def setUp(self):
+        self.normalizer = make_normalizer(self, {
+            'default': {'ip': 'source_ip', 'addr': 'source_ip'},
+            'network': {'src_ip': 'source_ip', 'client_ip': 'source_ip'},
+        })
+
+    def normalize_both_orders(self, fields):
+        """Normalize fields in the given key order and in reverse order."""
+        return [
+            self.normalizer._normalize_single_log({'log_source': 'network', **dict(order)}, 'now')[0]
+            for order in (fields, fields[::-1])
+        ]
+
+    def test_unmapped_field_beats_source_mapping(self):
+        for log in self.normalize_both_orders([('source_ip', '10.0.0.2'), ('src_ip', '10.0.0.1')]):
+            self.assertEqual(log['source_ip'], '10.0.0.2')
+
+    def test_source_mapping_beats_default_mapping(self):
+        for log in self.normalize_both_orders([('ip', '10.0.0.2'), ('src_ip', '10.0.0.1')]):
+            self.assertEqual(log['source_ip'], '10.0.0.1')
+
+    def test_unmapped_field_beats_default_mapping(self):
+        for log in self.normalize_both_orders([('ip', '10.0.0.2'), ('source_ip', '10.0.0.1')]):
+            self.assertEqual(log['source_ip'], '10.0.0.1')
+
+    def test_last_source_mapping_and_first_default_mapping_win(self):
+        source_first, source_last = self.normalize_both_orders(
+            [('src_ip', '10.0.0.1'), ('client_ip', '10.0.0.2')])
+        self.assertEqual(source_first['source_ip'], '10.0.0.2')
+        self.assertEqual(source_last['source_ip'], '10.0.0.1')
+        
+        default_first, default_last = self.normalize_both_orders(
+            [('ip', '10.0.0.1'), ('addr', '10.0.0.2')])
+        self.assertEqual(default_first['source_ip'], '10.0.0.1')
+        self.assertEqual(default_last['source_ip'], '10.0.0.2')
+
+
+class ReadWriteTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_wide_integers_round_trip_exactly(self):
+        wide = 2 ** 70 + 1
+        input_file = self.path('in.jsonl')
+        output_file = self.path('out.json')
+        with open(input_file, 'w') as f:
+            f.write(json.dumps({'event_id': wide}) + '\n')
+        
+        _write_logs(output_file, (_json_dumps_entry(log) for log in _read_logs(input_file)))
+        
+        with open(output_file) as f:
+            self.assertEqual(json.load(f), [{'event_id': wide}])
+
+
+    def test_wide_integer_literals_use_the_stdlib_parser(self):
+        wide = 2 ** 70
+        for document in (f'{wide}', f'[1, -{wide}]', f'{{"a": {wide} }}', f'{{\n  "a":\n    {wide}\n}}'):
+            self.assertEqual(json.loads(document), poc_normalizer._json_loads(document.encode()))
+            self.assertTrue(poc_normalizer._WIDE_INT_RE.search(document.encode()), document)
+
+    def test_long_digit_strings_and_floats_keep_the_fast_parser(self):
+        for document in (b'{"trace_id": "1700000000123456789"}', b'{"a": 12345678901234567890.5}',
+                         b'{"a": 12345678901234567890e2}', b'{"a": "x, 12345678901234567890"}'):
+            self.assertIsNone(poc_normalizer._WIDE_INT_RE.search(document), document)
+
+    def test_malformed_json_lines_are_skipped_with_their_line_number(self):
+        input_file = self.path('in.jsonl')
+        with open(input_file, 'w') as f:
+            f.write('{"a": 1}\n\n{"a": \n[1, 2]\n{"a": 2}\n')
+        stats = {'processed': 0, 'errors': 0}
+        
+        with self.assertLogs(level='WARNING') as logs:
+            entries = list(_read_logs(input_file, stats))
+        
+        self.assertEqual(entries, [{'a': 1}, {'a': 2}])
+        self.assertEqual(stats, {'processed': 2, 'errors': 2})
+        self.assertIn('line 3: invalid JSON', logs.output[0])
+        self.assertIn('line 4: not a JSON object', logs.output[1])
+
+    def test_input_that_is_neither_array_nor_json_lines_fails(self):
+        for content in ('{\n  "a": 1\n}\n', '\n{"logs": [\n  {"a": 1}\n]}\n',
+                        '\ufeff[\n  {"a": 1}\n]\n'):
+            input_file = self.path('in.json')
+            with open(input_file, 'w', encoding='utf-8') as f:
+                f.write(content)
+            
+            with self.assertRaises(json.JSONDecodeError), self.assertLogs(level='ERROR') as logs:
+                list(_read_logs(input_file))
+            self.assertIn('JSON array or JSON Lines', logs.output[0])
+
+    def test_failed_write_keeps_existing_output(self):
+        input_file = self.path('in.json')
+        output_file = self.path('out.json')
+        with open(input_file, 'w') as f:
+            f.write('[{"a": 1}, {"a": ')
+        with open(output_file, 'w') as f:
+            f.write('previous')
+        
+        with self.assertRaises(ValueError):
+            _write_logs(output_file, (_json_dumps_entry(log) for log in _read_logs(input_file)))
+        
+        with open(output_file) as f:
+            self.assertEqual(f.read(), 'previous')
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ['in.json', 'out.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()